@@ -4,13 +4,20 @@ Audio recording module for Lisn.
 Captures audio from the microphone using sounddevice.
 """
 
+from __future__ import annotations
+
+import functools
 import io
-import threading
+import queue
+import struct
+import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
-import sounddevice as sd
+
+if TYPE_CHECKING:
+    import sounddevice as sd
 
 
 class AudioError(Exception):
@@ -18,6 +25,24 @@ class AudioError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1)
+def _sounddevice():
+    """
+    Import sounddevice on first use.
+
+    Importing it dlopens the PortAudio shared library, which is too
+    expensive to pay for CLI commands that never touch audio.
+    """
+    import sounddevice
+    return sounddevice
+
+
+@functools.lru_cache(maxsize=1)
+def _query_devices_cached() -> tuple:
+    """Query PortAudio for the device list once and cache the result."""
+    return tuple(_sounddevice().query_devices())
+
+
 @dataclass
 class AudioRecorder:
     """
@@ -32,45 +57,107 @@ class AudioRecorder:
     sample_rate: int = 16000
     channels: int = 1
     device: Optional[str] = None
-    
+    max_seconds: int = 120  # Capacity of the pre-allocated recording buffer
+    silence_threshold: float = 0.01  # Normalized amplitude gate for speech
+
     # Internal state
     _recording: bool = field(default=False, init=False)
-    _audio_buffer: list = field(default_factory=list, init=False)
+    _ring: Optional[np.ndarray] = field(default=None, init=False)
+    _write_idx: int = field(default=0, init=False)
+    _last_audio: Optional[np.ndarray] = field(default=None, init=False)
     _stream: Optional[sd.InputStream] = field(default=None, init=False)
-    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    # Speech stats maintained incrementally by the callback, so trimming
+    # and the silence verdict are O(1) at stop time
+    _int_threshold: int = field(default=0, init=False)
+    _first_voice: int = field(default=-1, init=False)
+    _last_voice: int = field(default=0, init=False)
+    _voice_samples: int = field(default=0, init=False)
+    _abs_scratch: Optional[np.ndarray] = field(default=None, init=False)
+    _gt_scratch: Optional[np.ndarray] = field(default=None, init=False)
 
-    def _audio_callback(self, indata: np.ndarray, frames: int, 
+    def _audio_callback(self, indata: np.ndarray, frames: int,
                         time_info: dict, status: sd.CallbackFlags) -> None:
-        """Callback function called for each audio block."""
+        """Callback function called for each audio block.
+
+        Writes into the pre-allocated buffer; no allocation happens here so
+        the PortAudio thread never blocks on malloc or the GIL allocator.
+        The slice assignment below is itself the copy out of PortAudio's
+        transient block, so indata.copy() would be redundant. If the
+        buffer fills (recording longer than max_seconds), excess samples
+        are dropped rather than allocating more on the real-time thread.
+        """
         if status:
             # Log status flags (xruns, etc.) but don't fail
             pass
-        
-        # Copy the audio data to our buffer
-        with self._lock:
-            if self._recording:
-                self._audio_buffer.append(indata.copy())
+
+        if not self._recording:
+            return
+
+        ring = self._ring
+        idx = self._write_idx
+        n = min(frames, ring.shape[0] - idx)
+        if n > 0:
+            # Slice assignment copies indata into the buffer in-place
+            if ring.ndim == 1:
+                ring[idx:idx + n] = indata[:n, 0]
+                block = ring[idx:idx + n]
+            else:
+                ring[idx:idx + n] = indata[:n]
+                block = ring[idx:idx + n, 0]
+            self._write_idx = idx + n
+
+            # Update speech stats for this block through pre-allocated
+            # scratch buffers (still no malloc on the real-time thread)
+            if n <= len(self._abs_scratch):
+                abs_block = self._abs_scratch[:n]
+                gt_block = self._gt_scratch[:n]
+                np.abs(block, out=abs_block)
+                np.greater(abs_block, self._int_threshold, out=gt_block)
+                voiced = int(np.count_nonzero(gt_block))
+                if voiced:
+                    if self._first_voice < 0:
+                        self._first_voice = idx
+                    self._last_voice = idx + n
+                    self._voice_samples += voiced
 
     def start_recording(self) -> None:
         """
         Start recording audio from the microphone.
-        
+
         Raises:
             AudioError: If no audio device is available or recording fails.
         """
         if self._recording:
             return  # Already recording
-        
-        # Clear previous recording
-        with self._lock:
-            self._audio_buffer = []
-        
+
+        self._last_audio = None
+
+        # Allocate a fresh buffer for this recording before the stream starts,
+        # so no callback can be writing while we set up. A fresh array (rather
+        # than reuse) keeps previously returned audio valid for callers.
+        # Mono recordings are kept 1-D so downstream passes need no
+        # flatten/reshape copies.
+        capacity = self.max_seconds * self.sample_rate
+        shape = capacity if self.channels == 1 else (capacity, self.channels)
+        self._ring = np.empty(shape, dtype=np.int16)
+        self._write_idx = 0
+
+        # Reset speech stats and size the callback scratch buffers
+        self._int_threshold = int(self.silence_threshold * 32767)
+        self._first_voice = -1
+        self._last_voice = 0
+        self._voice_samples = 0
+        if self._abs_scratch is None:
+            self._abs_scratch = np.empty(8192, dtype=np.int16)
+            self._gt_scratch = np.empty(8192, dtype=bool)
+
+        sd = _sounddevice()
         try:
             self._stream = sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=self.channels,
                 device=self.device,
-                dtype=np.float32,
+                dtype=np.int16,
                 callback=self._audio_callback,
             )
             self._stream.start()
@@ -80,71 +167,171 @@ class AudioRecorder:
         except Exception as e:
             raise AudioError(f"Audio error: {e}") from e
 
-    def stop_recording(self) -> bytes:
+    def _finalize_array(self) -> Optional[np.ndarray]:
         """
-        Stop recording and return the audio data as bytes.
-        
+        Stop the stream and return the recorded audio as a numpy array.
+
         Returns:
-            Audio data as bytes (float32 numpy array serialized).
-            Returns empty bytes if no audio was recorded.
+            The filled prefix of the recording buffer, or None if nothing
+            was recorded.
         """
         if not self._recording:
-            return b""
-        
+            # Already stopped: hand back the same array, not a re-parse
+            return self._last_audio
+
         self._recording = False
-        
+
         if self._stream:
             self._stream.stop()
             self._stream.close()
             self._stream = None
-        
-        # Concatenate all audio chunks
-        with self._lock:
-            if not self._audio_buffer:
-                return b""
-            
-            audio_data = np.concatenate(self._audio_buffer, axis=0)
-            self._audio_buffer = []
-        
-        # Return as bytes
-        return audio_data.tobytes()
+
+        # Single-producer/single-consumer: the callback is the only writer
+        # of _write_idx, and we only read it here after stream.stop() has
+        # drained the callback, so no lock is needed on either side.
+        if self._ring is None or self._write_idx == 0:
+            self._last_audio = None
+            return None
+        audio = self._ring[:self._write_idx]
+        # Drop our reference so the buffer can be freed once the caller
+        # is done with it, instead of staying pinned between recordings.
+        self._ring = None
+        self._last_audio = audio
+        return audio
+
+    def iter_live_chunks(self, chunk_samples: int = 1600,
+                         poll_interval: float = 0.02):
+        """
+        Yield recorded audio incrementally while recording is in progress.
+
+        Blocks between chunks until enough samples arrive; finishes once
+        recording has stopped and the tail has been drained. Intended for
+        streaming uploads that start before the user releases the hotkey.
+
+        The recording buffer is bound eagerly at call time rather than on
+        the consumer's first read, so a press/release fast enough to
+        finalize the recording before the upload thread first polls still
+        streams the captured samples instead of a header-only file.
+
+        Args:
+            chunk_samples: Minimum samples per yielded chunk (default 100ms)
+            poll_interval: Sleep between polls while waiting for samples
+        """
+        ring = self._ring
+        if ring is None:
+            return iter(())
+        return self._iter_live(ring, chunk_samples, poll_interval)
+
+    def _iter_live(self, ring: np.ndarray, chunk_samples: int,
+                   poll_interval: float):
+        """Generator behind iter_live_chunks; ring is pre-bound."""
+        read = 0
+        while True:
+            # Read the flag before the index so a stop between the two
+            # can't make us miss the final samples
+            still_recording = self._recording
+            avail = self._write_idx
+
+            if avail - read >= chunk_samples or (not still_recording and avail > read):
+                chunk = ring[read:avail]
+                read = avail
+                yield chunk
+            elif not still_recording:
+                return
+            else:
+                time.sleep(poll_interval)
+
+    def stop_recording(self) -> bytes:
+        """
+        Stop recording and return the audio data as bytes.
+
+        Returns:
+            Audio data as bytes (int16 numpy array serialized).
+            Returns empty bytes if no audio was recorded.
+        """
+        audio_data = self._finalize_array()
+        return b"" if audio_data is None else audio_data.tobytes()
 
     def get_audio_numpy(self) -> Optional[np.ndarray]:
         """
         Stop recording and return the audio data as a numpy array.
-        
+
         Returns:
-            Audio data as numpy float32 array, or None if no audio.
+            Audio data as numpy int16 array, or None if no audio.
         """
-        audio_bytes = self.stop_recording()
-        if not audio_bytes:
+        return self._finalize_array()
+
+    def get_trimmed_audio(self, padding: float = 0.05) -> Optional[np.ndarray]:
+        """
+        Stop recording and return the audio with silence already trimmed.
+
+        Uses the speech bounds the callback tracked while recording, so
+        unlike trim_silence this makes no pass over the samples.
+
+        Args:
+            padding: Seconds of padding kept around the detected speech
+
+        Returns:
+            Trimmed audio as numpy int16 array, or None if no audio.
+        """
+        audio = self._finalize_array()
+        if audio is None:
             return None
-        
-        return np.frombuffer(audio_bytes, dtype=np.float32)
+
+        if self._voice_samples == 0:
+            return audio[:int(self.sample_rate * 0.1)]  # 100ms minimum
+
+        pad = int(self.sample_rate * padding)
+        start = max(0, self._first_voice - pad)
+        end = min(len(audio), self._last_voice + pad)
+        return audio[start:end]
+
+    def has_speech(self, min_speech_duration: float = 0.3) -> bool:
+        """
+        O(1) speech verdict from the stats the callback maintained.
+
+        Args:
+            min_speech_duration: Minimum speech required (seconds)
+        """
+        return self._voice_samples >= int(min_speech_duration * self.sample_rate)
 
     @property
     def is_recording(self) -> bool:
         """Check if currently recording."""
         return self._recording
 
+    @property
+    def last_audio(self) -> Optional[np.ndarray]:
+        """The most recently finished recording (shared, not a copy)."""
+        return self._last_audio
+
     @staticmethod
-    def list_devices() -> list[dict]:
-        """List available audio input devices."""
-        devices = []
-        for i, dev in enumerate(sd.query_devices()):
-            if dev['max_input_channels'] > 0:
-                devices.append({
-                    'index': i,
-                    'name': dev['name'],
-                    'channels': dev['max_input_channels'],
-                    'sample_rate': dev['default_samplerate'],
-                })
-        return devices
+    def list_devices(refresh: bool = False) -> list[dict]:
+        """
+        List available audio input devices.
+
+        Args:
+            refresh: Re-query PortAudio instead of using the cached device
+                     list (e.g. after plugging in a microphone).
+        """
+        if refresh:
+            _query_devices_cached.cache_clear()
+        return [
+            {
+                'index': i,
+                'name': dev['name'],
+                'channels': dev['max_input_channels'],
+                'sample_rate': dev['default_samplerate'],
+            }
+            for i, dev in enumerate(_query_devices_cached())
+            if dev['max_input_channels'] > 0
+        ]
 
     @staticmethod
     def get_default_device() -> Optional[dict]:
         """Get the default input device info."""
         try:
+            sd = _sounddevice()
             device_id = sd.default.device[0]  # Input device
             if device_id is None:
                 return None
@@ -159,38 +346,285 @@ class AudioRecorder:
             return None
 
 
-def to_wav_bytes(audio_data: np.ndarray, sample_rate: int = 16000) -> bytes:
+def to_wav_bytes(audio_data: np.ndarray, sample_rate: int = 16000) -> memoryview:
     """
     Convert numpy audio array to WAV bytes (16kHz mono, 16-bit PCM).
-    
+
     This format is compatible with Groq Whisper API.
-    
+
     Args:
-        audio_data: Audio as numpy float32 array (values in -1.0 to 1.0)
+        audio_data: Audio as numpy int16 array, or float32 with values
+            in -1.0 to 1.0 (converted on the fly)
         sample_rate: Sample rate in Hz (default 16000 for Whisper)
-    
+
     Returns:
-        WAV file as bytes
+        WAV file as a bytes-like memoryview over a pooled buffer; pass it
+        to release_wav_buffer when done to enable reuse
     """
-    import wave
-    
-    # Ensure mono
+    # Ensure mono. mean() promotes to float64 in the input's own sample
+    # units, so int16 input must be cast straight back - the *32767
+    # rescale below is only for normalized float input.
     if audio_data.ndim > 1:
+        was_int16 = audio_data.dtype == np.int16
         audio_data = audio_data.mean(axis=1)
-    
-    # Convert float32 (-1.0 to 1.0) to int16
-    audio_int16 = (audio_data * 32767).astype(np.int16)
-    
-    # Write to WAV bytes
-    buffer = io.BytesIO()
-    with wave.open(buffer, 'wb') as wav_file:
-        wav_file.setnchannels(1)  # Mono
-        wav_file.setsampwidth(2)  # 16-bit
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(audio_int16.tobytes())
-    
-    buffer.seek(0)
-    return buffer.read()
+        if was_int16:
+            audio_data = audio_data.astype(np.int16)
+
+    n = len(audio_data)
+    data_size = n * 2  # 16-bit samples
+
+    # Build header + data chunk in one buffer from the reuse pool: no wave
+    # module, no BytesIO, and the conversion writes straight into it.
+    out = _acquire_wav_buffer(44 + data_size)
+    out[:44] = _wav_header(sample_rate, n)
+
+    # int16 view over the data chunk; assigning through it converts in place
+    pcm = np.frombuffer(out, dtype=np.int16, offset=44, count=n)
+    if audio_data.dtype == np.int16:
+        pcm[:] = audio_data
+    else:
+        global _f32_scratch
+        if _f32_scratch is None or len(_f32_scratch) < n:
+            _f32_scratch = np.empty(n, dtype=np.float32)
+        scaled = _f32_scratch[:n]
+        np.multiply(audio_data, 32767.0, out=scaled)
+        # Clamp before the cast so out-of-range floats can't wrap
+        np.clip(scaled, -32768.0, 32767.0, out=scaled)
+        np.copyto(pcm, scaled, casting='unsafe')
+
+    return memoryview(out)[:44 + data_size]
+
+
+@functools.lru_cache(maxsize=1)
+def _soundfile():
+    """Import soundfile on first use, or None when it isn't installed."""
+    try:
+        import soundfile
+        return soundfile
+    except ImportError:
+        return None
+
+
+def to_flac_bytes(audio_data: np.ndarray, sample_rate: int = 16000) -> Optional[bytes]:
+    """
+    Encode int16 audio as FLAC for upload.
+
+    FLAC is lossless and roughly halves the payload versus PCM WAV, which
+    matters on residential upstream. Requires the optional soundfile
+    package; returns None when it isn't installed so callers can fall
+    back to to_wav_bytes.
+
+    Args:
+        audio_data: Audio samples as numpy int16 array
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        FLAC-encoded bytes, or None if soundfile is unavailable.
+    """
+    sf = _soundfile()
+    if sf is None:
+        return None
+
+    buf = io.BytesIO()
+    sf.write(buf, audio_data, sample_rate, format="FLAC", subtype="PCM_16")
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=8)
+def _wav_header(sample_rate: int, num_samples: int) -> bytes:
+    """Build the 44-byte RIFF/WAVE header for 16-bit mono PCM.
+
+    Cached: this app emits one fixed format, and short utterances repeat
+    sample counts often enough that the pack is usually skipped entirely.
+    """
+    data_size = num_samples * 2
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b'data', data_size,
+    )
+
+
+def iter_wav_chunks(
+    audio_data: np.ndarray,
+    sample_rate: int = 16000,
+    chunk_samples: int = 8192,
+):
+    """
+    Yield a WAV file incrementally: the header, then fixed-size PCM chunks.
+
+    Unlike to_wav_bytes, this never holds the whole encoded file in
+    memory, so the upload can start while later chunks are still being
+    converted.
+
+    Args:
+        audio_data: Audio as numpy int16 or float32 array
+        sample_rate: Sample rate in Hz
+        chunk_samples: Samples per yielded chunk
+
+    Yields:
+        Byte chunks forming a complete WAV file.
+    """
+    # Downmix as in to_wav_bytes: int16 input comes back as int16 so it
+    # takes the no-rescale branch below
+    if audio_data.ndim > 1:
+        was_int16 = audio_data.dtype == np.int16
+        audio_data = audio_data.mean(axis=1)
+        if was_int16:
+            audio_data = audio_data.astype(np.int16)
+
+    n = len(audio_data)
+    yield _wav_header(sample_rate, n)
+
+    if audio_data.dtype == np.int16:
+        for i in range(0, n, chunk_samples):
+            yield audio_data[i:i + chunk_samples].tobytes()
+    else:
+        # Convert float chunks through one reusable scratch buffer
+        scratch = np.empty(chunk_samples, dtype=np.int16)
+        for i in range(0, n, chunk_samples):
+            src = audio_data[i:i + chunk_samples]
+            dst = scratch[:len(src)]
+            np.multiply(src, 32767.0, out=dst, casting='unsafe')
+            yield dst.tobytes()
+
+
+class WavStream(io.RawIOBase):
+    """
+    Read-only file object presenting a recording as a WAV file.
+
+    Suitable as an upload body: bytes are produced on demand from
+    iter_wav_chunks instead of encoding the whole file up front.
+    """
+
+    def __init__(self, audio_data: np.ndarray, sample_rate: int = 16000):
+        self.name = "audio.wav"
+        self._chunks = iter_wav_chunks(audio_data, sample_rate)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            parts = [self._pending, *self._chunks]
+            self._pending = b""
+            return b"".join(parts)
+
+        while len(self._pending) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._pending += chunk
+
+        out, self._pending = self._pending[:size], self._pending[size:]
+        return out
+
+
+class LiveWavStream(WavStream):
+    """
+    WAV stream over audio that is still being recorded.
+
+    Wraps AudioRecorder.iter_live_chunks so an upload can run while the
+    user is still speaking. The total length is unknown up front, so the
+    RIFF and data sizes carry 0xFFFFFFFF placeholders, which streaming
+    decoders treat as "read until EOF".
+    """
+
+    def __init__(self, chunk_iter, sample_rate: int = 16000,
+                 channels: int = 1):
+        self.name = "audio.wav"
+        self._chunks = self._encode(chunk_iter, sample_rate, channels)
+        self._pending = b""
+
+    @staticmethod
+    def _encode(chunk_iter, sample_rate: int, channels: int):
+        # The header must match the raw frames yielded below, so the
+        # channel count (and derived byte rate / block align) comes from
+        # the recorder rather than assuming mono
+        yield struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 0xFFFFFFFF, b'WAVE',
+            b'fmt ', 16, 1, channels, sample_rate,
+            sample_rate * 2 * channels, 2 * channels, 16,
+            b'data', 0xFFFFFFFF,
+        )
+        for chunk in chunk_iter:
+            yield chunk.tobytes()
+
+
+# Reusable scratch for the float->int16 WAV conversion path, grown on demand
+_f32_scratch: Optional[np.ndarray] = None
+
+# Pool of WAV output buffers reused across dictations. to_wav_bytes fills a
+# pooled bytearray; callers that are done uploading can hand the result back
+# via release_wav_buffer so steady-state encoding allocates nothing.
+_WAV_POOL: queue.LifoQueue = queue.LifoQueue(maxsize=4)
+
+
+def _acquire_wav_buffer(size: int) -> bytearray:
+    """Get a bytearray of at least the given size, reusing pooled ones.
+
+    Never resizes a pooled buffer: resizing a bytearray with a live
+    memoryview export raises BufferError, and a caller may legitimately
+    still hold the view it released. Undersized buffers are simply
+    dropped in favor of a fresh allocation.
+    """
+    try:
+        buf = _WAV_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(size)
+    if len(buf) < size:
+        return bytearray(size)
+    return buf
+
+
+def release_wav_buffer(wav) -> None:
+    """
+    Return a buffer produced by to_wav_bytes to the reuse pool.
+
+    Safe to call while the returned memoryview is still in scope: the
+    view's export is released here, and a later encode never resizes a
+    pooled buffer anyway. The contents may be overwritten once released,
+    so callers must be done reading them (e.g. the upload completed).
+    Best effort: a full pool just drops the buffer.
+    """
+    if isinstance(wav, memoryview):
+        buf = wav.obj
+        wav.release()
+    else:
+        buf = wav
+    if isinstance(buf, bytearray):
+        try:
+            _WAV_POOL.put_nowait(buf)
+        except queue.Full:
+            pass
+
+
+# Decimation factor for the amplitude gate: a 0.01-amplitude threshold does
+# not need 16 kHz resolution, and a strided view costs nothing to build.
+_SILENCE_DECIMATE = 16
+
+
+def _scan_energy(samples: np.ndarray, threshold: float) -> tuple[int, int, int]:
+    """
+    Single amplitude scan shared by trim_silence and is_silent.
+
+    Returns:
+        Tuple of (first_idx, last_idx, count) for samples whose absolute
+        value exceeds the threshold, or (-1, -1, 0) if none do.
+    """
+    above = np.abs(samples) > threshold
+    # count_nonzero works on the raw bool bytes; np.sum would upcast to int64
+    count = int(np.count_nonzero(above))
+    if count == 0:
+        return -1, -1, 0
+
+    # argmax finds the first True without materializing an index array
+    first = int(above.argmax())
+    last = len(above) - 1 - int(above[::-1].argmax())
+    return first, last, count
 
 
 def trim_silence(
@@ -213,22 +647,26 @@ def trim_silence(
     """
     if len(audio_data) == 0:
         return audio_data
-    
-    # Calculate energy per sample
-    abs_audio = np.abs(audio_data.flatten())
-    
-    # Find where audio exceeds threshold
-    above_threshold = abs_audio > threshold
-    
-    if not np.any(above_threshold):
+
+    if audio_data.dtype.kind == 'i':
+        # int16 capture: scale the normalized threshold to sample units
+        threshold = int(threshold * 32767)
+
+    first, last, count = _scan_energy(
+        audio_data.reshape(-1)[::_SILENCE_DECIMATE], threshold
+    )
+
+    if count == 0:
         # All silence - return empty or very short
         return audio_data[:int(sample_rate * 0.1)]  # 100ms minimum
-    
-    # Find first and last non-silent sample
-    non_silent_indices = np.where(above_threshold)[0]
-    start_idx = max(0, non_silent_indices[0] - int(sample_rate * 0.05))  # 50ms padding
-    end_idx = min(len(audio_data), non_silent_indices[-1] + int(sample_rate * 0.05))
-    
+
+    # Map decimated indices back to sample positions
+    first *= _SILENCE_DECIMATE
+    last = last * _SILENCE_DECIMATE + _SILENCE_DECIMATE - 1
+
+    start_idx = max(0, first - int(sample_rate * 0.05))  # 50ms padding
+    end_idx = min(len(audio_data), last + int(sample_rate * 0.05))
+
     return audio_data[start_idx:end_idx]
 
 
@@ -252,11 +690,24 @@ def is_silent(
     """
     if len(audio_data) == 0:
         return True
-    
-    # Count samples above threshold
-    above_threshold = np.abs(audio_data.flatten()) > threshold
-    speech_samples = np.sum(above_threshold)
-    speech_duration = speech_samples / sample_rate
-    
-    return speech_duration < min_speech_duration
+
+    if audio_data.dtype.kind == 'i':
+        # int16 capture: scale the normalized threshold to sample units
+        threshold = int(threshold * 32767)
+
+    # Scan 100ms windows over the decimated view and stop as soon as
+    # enough speech has been seen - a loud utterance is confirmed within
+    # its first few windows without touching the rest of the array.
+    samples = audio_data.reshape(-1)[::_SILENCE_DECIMATE]
+    window = max(1, int(0.1 * sample_rate) // _SILENCE_DECIMATE)
+    needed = max(1, int(min_speech_duration * sample_rate) // _SILENCE_DECIMATE)
+
+    count = 0
+    for start in range(0, len(samples), window):
+        chunk = samples[start:start + window]
+        count += int(np.count_nonzero(np.abs(chunk) > threshold))
+        if count >= needed:
+            return False
+
+    return True
 
@@ -12,7 +12,6 @@ Commands:
 import click
 
 from lisn import __version__
-from lisn.config import Config
 
 
 @click.group()
@@ -31,6 +30,8 @@ def main():
               help="Your Groq API key (get one at console.groq.com)")
 def setup(api_key: str):
     """Configure Lisn with your API key and preferences."""
+    from lisn.config import Config
+
     config = Config.load()
     config.api.api_key = api_key
     config.save()
@@ -44,8 +45,9 @@ def setup(api_key: str):
 @main.command()
 def status():
     """Show current status and configuration."""
+    from lisn.config import Config
     from lisn.process import get_status
-    
+
     config = Config.load()
     errors = config.validate()
     daemon_status = get_status()
@@ -92,8 +94,9 @@ def status():
 @click.option("--foreground", "-f", is_flag=True, help="Run in foreground (don't daemonize)")
 def start(foreground: bool):
     """Start the dictation daemon."""
+    from lisn.config import Config
     from lisn.process import start_daemon, is_running
-    
+
     config = Config.load()
     errors = config.validate()
     
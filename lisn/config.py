@@ -4,11 +4,20 @@ Configuration management for Lisn.
 Handles loading, saving, and validating configuration from ~/.config/lisn/config.yaml
 """
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 import yaml
 
+try:
+    # libyaml parser/emitter: 5-10x faster than the pure-Python ones
+    from yaml import CSafeLoader as _YamlLoader
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+    from yaml import SafeDumper as _YamlDumper
+
 
 # Default config directory
 CONFIG_DIR = Path.home() / ".config" / "lisn"
@@ -39,6 +48,10 @@ class Config:
     audio: AudioConfig = field(default_factory=AudioConfig)
     api: ApiConfig = field(default_factory=ApiConfig)
 
+    # (mtime, Config) of the last successful load, so repeated in-process
+    # loads don't re-parse an unchanged file
+    _cache: ClassVar[Optional[tuple]] = None
+
     @classmethod
     def get_config_path(cls) -> Path:
         """Return the path to the config file."""
@@ -55,32 +68,46 @@ class Config:
             config.save()
             return config
 
+        mtime = CONFIG_FILE.stat().st_mtime
+        if cls._cache is not None and cls._cache[0] == mtime:
+            return cls._cache[1]
+
         with open(CONFIG_FILE, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
 
-        return cls._from_dict(data)
+        config = cls._from_dict(data)
+        cls._cache = (mtime, config)
+        return config
 
     @classmethod
     def _from_dict(cls, data: dict) -> "Config":
-        """Create Config from dictionary."""
-        audio_data = data.get("audio", {})
-        api_data = data.get("api", {})
+        """Create Config from dictionary.
+
+        Sections are filtered against the dataclass fields in one pass, so
+        defaults live only on the dataclasses and unknown keys (e.g. from a
+        newer config file) are ignored instead of raising.
+        """
+        audio_fields = AudioConfig.__dataclass_fields__
+        api_fields = ApiConfig.__dataclass_fields__
 
         return cls(
-            audio=AudioConfig(
-                sample_rate=audio_data.get("sample_rate", 16000),
-                channels=audio_data.get("channels", 1),
-                device=audio_data.get("device"),
-            ),
-            api=ApiConfig(
-                api_key=api_data.get("api_key", ""),
-                whisper_model=api_data.get("whisper_model", "whisper-large-v3-turbo"),
-                llm_model=api_data.get("llm_model", "openai/gpt-oss-20b"),
-            ),
+            audio=AudioConfig(**{
+                k: v for k, v in data.get("audio", {}).items()
+                if k in audio_fields
+            }),
+            api=ApiConfig(**{
+                k: v for k, v in data.get("api", {}).items()
+                if k in api_fields
+            }),
         )
 
     def save(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file.
+
+        Skips the write when the on-disk content is already current, and
+        writes through a temp file + rename so concurrent CLI invocations
+        never see a torn file.
+        """
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
         data = {
@@ -96,8 +123,19 @@ class Config:
             },
         }
 
-        with open(CONFIG_FILE, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        content = yaml.dump(
+            data, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+        )
+
+        try:
+            if CONFIG_FILE.read_text() == content:
+                return  # Unchanged - don't touch the file
+        except OSError:
+            pass
+
+        tmp_file = CONFIG_FILE.with_suffix(".yaml.tmp")
+        tmp_file.write_text(content)
+        os.replace(tmp_file, CONFIG_FILE)
 
     def validate(self) -> list[str]:
         """
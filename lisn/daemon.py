@@ -5,27 +5,53 @@ Orchestrates the full dictation flow:
 hotkey press → audio recording → transcription → formatting → text injection
 """
 
+import hashlib
+import os
+import queue
+import selectors
 import signal
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from typing import Callable, Optional
 
 from lisn.config import Config
-from lisn.audio import AudioRecorder, to_wav_bytes, is_silent, trim_silence
+from lisn.format import local_format
+from lisn.audio import (AudioRecorder, LiveWavStream, to_wav_bytes,
+                        to_flac_bytes, release_wav_buffer)
 from lisn.groq_client import GroqClient, GroqClientError
 from lisn.hotkey import HotkeyListener, HotkeyError
 from lisn.injector import TextInjector, InjectorError
 from lisn.widget import RecordingWidget, WidgetState, WidgetThread
 
 
-class DaemonState(Enum):
-    """State of the daemon."""
-    IDLE = "idle"
-    RECORDING = "recording"
-    PROCESSING = "processing"
-    ERROR = "error"
+# Max entries in the utterance -> text result cache
+_RESULT_CACHE_SIZE = 256
+
+
+class DaemonState(IntEnum):
+    """State of the daemon.
+
+    IntEnum so the state compares on the hotkey path go through plain
+    int equality instead of Enum.__eq__.
+    """
+    IDLE = 0
+    RECORDING = 1
+    PROCESSING = 2
+    ERROR = 3
+
+
+# Daemon state -> widget state, hoisted so _set_state doesn't rebuild a
+# dict on every transition. Exhaustive: direct indexing, no .get default.
+_STATE_TO_WIDGET = {
+    DaemonState.IDLE: WidgetState.HIDDEN,
+    DaemonState.RECORDING: WidgetState.RECORDING,
+    DaemonState.PROCESSING: WidgetState.PROCESSING,
+    DaemonState.ERROR: WidgetState.ERROR,
+}
 
 
 @dataclass
@@ -47,6 +73,7 @@ class DaemonProcess:
     
     config: Config = field(default_factory=Config.load)
     show_widget: bool = True  # Show visual indicator
+    stream_upload: bool = False  # Upload audio to Groq while still recording
     on_state_change: Optional[Callable[[DaemonState], None]] = None
     on_transcription: Optional[Callable[[str], None]] = None
     
@@ -61,29 +88,59 @@ class DaemonProcess:
     _widget_thread: Optional[WidgetThread] = field(default=None, init=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
     _stop_event: threading.Event = field(default_factory=threading.Event, init=False)
+    # Streaming upload for the dictation currently being recorded. A
+    # per-upload Future (not a shared result slot) so an upload that
+    # outlives its dictation can never leak text into the next one.
+    _stream_future: Optional[Future] = field(default=None, init=False)
+    _result_cache: OrderedDict = field(default_factory=OrderedDict, init=False)
+    _pool: Optional[ThreadPoolExecutor] = field(default=None, init=False)
+    # Circuit breaker: while monotonic() is below this, skip the LLM
+    # formatter - when Whisper is rate-limited the LLM almost surely is
+    # too, and stacking both retry ladders can sleep for seconds
+    _rate_limit_until: float = field(default=0.0, init=False)
+    # Self-pipe that wakes the main loop on stop() or signal delivery
+    _wake_r: int = field(default=-1, init=False)
+    _wake_w: int = field(default=-1, init=False)
+    # State notifications are dispatched from one worker so a slow widget
+    # or callback can't stall the hotkey handlers (which call _set_state
+    # while holding _lock)
+    _cb_q: queue.SimpleQueue = field(default_factory=queue.SimpleQueue, init=False)
+    _cb_thread: Optional[threading.Thread] = field(default=None, init=False)
+    _error_timer: Optional[threading.Timer] = field(default=None, init=False)
 
-    def _set_state(self, state: DaemonState) -> None:
-        """Update state and notify listeners."""
+    def _set_state(self, state: DaemonState,
+                   message: Optional[str] = None) -> None:
+        """Update state and hand notification off to the dispatch worker.
+
+        The optional widget message travels through the same queue as
+        the state, so it is applied after set_state's generic message
+        and ordering matches what the caller intended.
+        """
         self._state = state
-        
-        # Update widget
-        if self._widget:
-            state_map = {
-                DaemonState.IDLE: WidgetState.HIDDEN,
-                DaemonState.RECORDING: WidgetState.RECORDING,
-                DaemonState.PROCESSING: WidgetState.PROCESSING,
-                DaemonState.ERROR: WidgetState.ERROR,
-            }
-            try:
-                self._widget.set_state(state_map.get(state, WidgetState.HIDDEN))
-            except Exception:
-                pass
-        
-        if self.on_state_change:
-            try:
-                self.on_state_change(state)
-            except Exception:
-                pass  # Don't let callback errors crash daemon
+        self._cb_q.put((state, message))
+
+    def _drain_callbacks(self) -> None:
+        """Deliver state notifications; runs on a dedicated worker thread."""
+        while True:
+            item = self._cb_q.get()
+            if item is None:  # Sentinel from _cleanup
+                break
+            state, message = item
+
+            # Update widget
+            if self._widget:
+                try:
+                    self._widget.set_state(_STATE_TO_WIDGET[state])
+                    if message is not None:
+                        self._widget.update_message(message)
+                except Exception:
+                    pass
+
+            if self.on_state_change:
+                try:
+                    self.on_state_change(state)
+                except Exception:
+                    pass  # Don't let callback errors crash daemon
 
     def _on_hotkey_press(self) -> None:
         """Handle hotkey press - start recording."""
@@ -93,13 +150,20 @@ class DaemonProcess:
             
             self._set_state(DaemonState.RECORDING)
         
+        # A pending error-banner timer must not flip state mid-recording
+        if self._error_timer:
+            self._error_timer.cancel()
+            self._error_timer = None
+        
         try:
             self._recorder.start_recording()
+            if self.stream_upload:
+                self._start_stream_upload()
         except Exception as e:
             print(f"[Lisn] Recording error: {e}")
-            self._set_state(DaemonState.ERROR)
-            time.sleep(1)
-            self._set_state(DaemonState.IDLE)
+            # Timer-held banner, not a sleep: this runs on the hotkey
+            # listener's callback worker, which must stay responsive
+            self._show_error("Recording error")
 
     def _on_hotkey_release(self) -> None:
         """Handle hotkey release - stop recording and process."""
@@ -109,56 +173,140 @@ class DaemonProcess:
             
             self._set_state(DaemonState.PROCESSING)
         
-        # Process in background thread to not block hotkey listener
-        threading.Thread(target=self._process_recording, daemon=True).start()
+        # Process on the worker pool to not block the hotkey listener.
+        # The pool is persistent (no per-dictation thread spawn) and
+        # bounded so overlapping dictations can't stampede the API.
+        future = self._pool.submit(self._process_recording)
+        future.add_done_callback(self._log_worker_error)
+
+    @staticmethod
+    def _log_worker_error(future) -> None:
+        """Surface exceptions that escaped a pooled _process_recording."""
+        exc = future.exception()
+        if exc is not None:
+            print(f"[Lisn] Processing error: {exc}")
+
+    def _start_stream_upload(self) -> None:
+        """Begin uploading the recording to Groq while it is in progress.
+
+        By the time the hotkey is released, most of the audio is already
+        on the wire and only the tail plus server compute remain. The
+        result comes back through a per-upload Future so it can only
+        ever be read by the dictation that started the upload.
+        """
+        stream = LiveWavStream(
+            self._recorder.iter_live_chunks(),
+            sample_rate=self.config.audio.sample_rate,
+            channels=self.config.audio.channels,
+        )
+        future = Future()
+
+        def _upload():
+            try:
+                future.set_result(self._groq_client.transcribe_audio(stream))
+            except Exception as e:
+                future.set_exception(e)
+
+        self._stream_future = future
+        threading.Thread(target=_upload, daemon=True).start()
 
     def _process_recording(self) -> None:
         """Process the recorded audio: transcribe, format, inject."""
         try:
-            # Get audio data
-            audio = self._recorder.get_audio_numpy()
+            # Claim this dictation's streaming upload (if any) up front:
+            # every return path below then abandons it, instead of
+            # leaving a live upload whose late result the next dictation
+            # could mistake for its own
+            stream_future, self._stream_future = self._stream_future, None
+
+            # Get audio data, pre-trimmed from the stats the recording
+            # callback maintained - no post-capture array passes here
+            audio = self._recorder.get_trimmed_audio()
             
             if audio is None or len(audio) == 0:
                 self._set_state(DaemonState.IDLE)
                 return
             
-            # Trim silence
-            audio = trim_silence(audio, sample_rate=self.config.audio.sample_rate)
-
-            # Check if mostly silent
-            if is_silent(audio, sample_rate=self.config.audio.sample_rate):
+            # Check if mostly silent (O(1) from the same stats)
+            if not self._recorder.has_speech():
                 self._set_state(DaemonState.IDLE)
                 return
             
-            # Convert to WAV
-            wav_bytes = to_wav_bytes(audio, sample_rate=self.config.audio.sample_rate)
-            
-            # Transcribe with retry
-            text = None
-            for attempt in range(2):
-                try:
-                    result = self._groq_client.transcribe_audio(wav_bytes)
-                    text = result.text
-                    break
-                except GroqClientError as e:
-                    if attempt == 0 and "rate" in str(e).lower():
-                        time.sleep(0.5)  # Brief pause for rate limits
-                        continue
-                    raise
-
-            if not text or not text.strip():
-                self._set_state(DaemonState.IDLE)
-                return
+            # Short utterances repeat often ("yes", "okay") - identical
+            # trimmed audio skips both Groq round trips via this cache
+            audio_key = (
+                hashlib.blake2b(audio.tobytes(), digest_size=16).digest(),
+                self.config.api.whisper_model,
+                self.config.api.llm_model,
+            )
+            formatted_text = self._result_cache.get(audio_key)
+            if formatted_text is not None:
+                self._result_cache.move_to_end(audio_key)
+            else:
+                # Prefer the in-flight streaming upload if one was started at
+                # hotkey-press time; fall back to the batch path otherwise
+                text = None
+                if stream_future is not None:
+                    try:
+                        result = stream_future.result(
+                            timeout=self._groq_client.timeout
+                        )
+                        text = result.text
+                    except Exception:
+                        pass  # Timed out or failed - use the batch upload
 
-            # Format with LLM (optional, can be disabled)
-            try:
-                formatted_text = self._groq_client.format_text(
-                    text, 
-                    llm_model=self.config.api.llm_model
-                )
-            except GroqClientError:
-                # On formatting error, use raw transcription
-                formatted_text = text
+                if text is None:
+                    # Prefer FLAC (~2x smaller upload, lossless); fall back
+                    # to PCM WAV when soundfile isn't installed
+                    wav_bytes = None
+                    payload = to_flac_bytes(audio, sample_rate=self.config.audio.sample_rate)
+                    filename = "audio.flac"
+                    if payload is None:
+                        wav_bytes = to_wav_bytes(audio, sample_rate=self.config.audio.sample_rate)
+                        payload = wav_bytes
+                        filename = "audio.wav"
+
+                    # Transcribe with retry
+                    try:
+                        for attempt in range(2):
+                            try:
+                                result = self._groq_client.transcribe_audio(
+                                    payload, filename=filename
+                                )
+                                text = result.text
+                                break
+                            except GroqClientError as e:
+                                if "rate" in str(e).lower():
+                                    self._rate_limit_until = time.monotonic() + 5.0
+                                    if attempt == 0:
+                                        time.sleep(0.5)  # Brief pause for rate limits
+                                        continue
+                                raise
+                    finally:
+                        # Upload finished - recycle the WAV buffer
+                        if wav_bytes is not None:
+                            release_wav_buffer(wav_bytes)
+
+                if not text or not text.strip():
+                    self._set_state(DaemonState.IDLE)
+                    return
+
+                # Cheap local formatting first; only pay the LLM round
+                # trip when the text is long/unusual enough to need it
+                formatted_text, needs_llm = local_format(text)
+                if (needs_llm and self.config.api.llm_model
+                        and time.monotonic() >= self._rate_limit_until):
+                    try:
+                        formatted_text = self._groq_client.format_text(
+                            text, 
+                            llm_model=self.config.api.llm_model
+                        )
+                    except GroqClientError:
+                        pass  # Keep the locally formatted text
+
+                self._result_cache[audio_key] = formatted_text
+                if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
 
             # Notify listeners
             if self.on_transcription:
@@ -167,11 +315,10 @@ class DaemonProcess:
                 except Exception:
                     pass
             
-            # Inject text into focused window (add trailing space for next dictation)
+            # Inject text into focused window (add trailing space for next
+            # dictation); the finally clause handles the return to IDLE
             try:
                 self._injector.inject_text(formatted_text + " ")
-                # Show success briefly
-                self._set_state(DaemonState.IDLE)
             except InjectorError as e:
                 self._show_error(f"Injection failed")
             
@@ -180,6 +327,7 @@ class DaemonProcess:
             if "api_key" in error_msg.lower() or "auth" in error_msg.lower():
                 self._show_error("Invalid API key")
             elif "rate" in error_msg.lower():
+                self._rate_limit_until = time.monotonic() + 5.0
                 self._show_error("Rate limited")
             elif "connect" in error_msg.lower() or "network" in error_msg.lower():
                 self._show_error("No internet")
@@ -188,25 +336,47 @@ class DaemonProcess:
         except Exception as e:
             self._show_error("Error")
         finally:
-            # Ensure we return to idle after error display
-            if self._state == DaemonState.ERROR:
-                time.sleep(1.5)  # Show error briefly
+            # Single return-to-idle transition per dictation. The ERROR
+            # state clears itself via the timer _show_error scheduled, so
+            # this worker is immediately free for the next dictation.
+            if self._state not in (DaemonState.IDLE, DaemonState.ERROR):
                 self._set_state(DaemonState.IDLE)
 
     def _show_error(self, message: str) -> None:
-        """Show error in widget and set error state."""
-        self._set_state(DaemonState.ERROR)
-        if self._widget:
-            self._widget.update_message(f"❌ {message}")
+        """Show error in widget and schedule the return to IDLE.
+
+        Non-blocking: the banner is held by a timer rather than by
+        sleeping on a worker thread.
+        """
+        self._set_state(DaemonState.ERROR, message=f"❌ {message}")
+
+        if self._error_timer:
+            self._error_timer.cancel()
+        self._error_timer = threading.Timer(1.5, self._clear_error)
+        self._error_timer.daemon = True
+        self._error_timer.start()
+
+    def _clear_error(self) -> None:
+        """Timer target: drop the error banner if it is still showing."""
+        if self._state == DaemonState.ERROR:
+            self._set_state(DaemonState.IDLE)
 
     def _setup_signal_handlers(self) -> None:
-        """Set up graceful shutdown on SIGINT/SIGTERM."""
+        """Set up graceful shutdown on SIGINT/SIGTERM.
+
+        Signals also write a byte to the wake pipe (set_wakeup_fd), so
+        the main loop unblocks immediately instead of on its next poll.
+        """
         def handle_signal(signum, frame):
             if not self._running:
                 return  # Already stopping
             print("\n[Lisn] Shutting down...")
             self.stop()
         
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        signal.set_wakeup_fd(self._wake_w)
+        
         signal.signal(signal.SIGINT, handle_signal)
         signal.signal(signal.SIGTERM, handle_signal)
 
@@ -234,6 +404,18 @@ class DaemonProcess:
             whisper_model=self.config.api.whisper_model,
         )
         
+        # Warm up the TLS connection in the background so the first
+        # dictation doesn't pay connection setup on the hotkey path
+        threading.Thread(target=self._groq_client.warm_up, daemon=True).start()
+
+        # Persistent worker pool for post-release processing
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lisn-proc")
+
+        # State-notification dispatcher
+        self._cb_thread = threading.Thread(target=self._drain_callbacks, daemon=True)
+        self._cb_thread.start()
+        
+        
         self._injector = TextInjector()
         
         # Initialize widget for visual feedback (runs GTK in background thread)
@@ -259,17 +441,32 @@ class DaemonProcess:
         
         print("[Lisn] Ready! Hold CAPSLOCK to dictate.")
         
-        # Block until stopped
+        # Block until stopped. The selector waits on the wake pipe with
+        # no timeout - stop() and signal delivery both write a byte, so
+        # shutdown latency is ~1ms instead of up to the old 500ms poll.
+        sel = selectors.DefaultSelector()
+        sel.register(self._wake_r, selectors.EVENT_READ)
         try:
             while self._running and not self._stop_event.is_set():
-                self._stop_event.wait(timeout=0.5)
+                if sel.select():
+                    os.read(self._wake_r, 4096)  # Drain wake bytes
         finally:
+            signal.set_wakeup_fd(-1)
+            sel.close()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = -1
             self._cleanup()
 
     def stop(self) -> None:
         """Stop the daemon gracefully."""
         self._running = False
         self._stop_event.set()
+        if self._wake_w >= 0:
+            try:
+                os.write(self._wake_w, b"\x00")
+            except OSError:
+                pass  # Pipe full or already closed - loop is waking anyway
 
     def _cleanup(self) -> None:
         """Clean up resources."""
@@ -282,7 +479,18 @@ class DaemonProcess:
         if self._widget_thread:
             self._widget_thread.stop()
         
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        
+        if self._error_timer:
+            self._error_timer.cancel()
+        
         self._set_state(DaemonState.IDLE)
+        
+        if self._cb_thread:
+            self._cb_q.put(None)
+            self._cb_thread.join(timeout=1.0)
+        
         print("[Lisn] Stopped.")
 
     @property
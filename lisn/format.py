@@ -0,0 +1,55 @@
+"""
+Local text formatting for Lisn.
+
+Cheap rule-based cleanup that covers most short dictations, so the LLM
+formatting round trip (~200-500ms) only happens when it is likely to
+actually improve the text.
+"""
+
+import re
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TERMINAL_PUNCTUATION = (".", "!", "?", ":", ";")
+# Signs the rules below won't handle well: embedded code or symbols the
+# LLM knows how to punctuate around
+_NEEDS_LLM_RE = re.compile(r"[{}<>`_=\\|]|::|->")
+# Beyond this, the text likely needs sentence splitting
+_MAX_LOCAL_WORDS = 30
+
+
+def local_format(text: str) -> tuple[str, bool]:
+    """
+    Apply cheap local formatting to a transcription.
+
+    Rules: collapse repeated whitespace, capitalize the first letter,
+    and ensure terminal punctuation.
+
+    Args:
+        text: Raw transcribed text
+
+    Returns:
+        (formatted, needs_llm) - needs_llm is True when the text is long
+        or unusual enough that the LLM formatter is worth its round trip.
+    """
+    stripped = text.strip()
+    if not stripped:
+        return stripped, False
+
+    formatted = _WHITESPACE_RE.sub(" ", stripped)
+
+    # Capitalize the first alphabetic character
+    for i, ch in enumerate(formatted):
+        if ch.isalpha():
+            if ch.islower():
+                formatted = formatted[:i] + ch.upper() + formatted[i + 1:]
+            break
+
+    if not formatted.endswith(_TERMINAL_PUNCTUATION):
+        formatted += "."
+
+    needs_llm = (
+        formatted.count(" ") + 1 > _MAX_LOCAL_WORDS
+        or _NEEDS_LLM_RE.search(formatted) is not None
+    )
+    return formatted, needs_llm
@@ -4,11 +4,11 @@ Groq API client for Lisn.
 Handles speech-to-text transcription using Groq's Whisper API.
 """
 
-import io
 import time
 from dataclasses import dataclass
 from typing import Optional
 
+import httpx
 from groq import Groq, APIError, APIConnectionError, RateLimitError
 
 
@@ -55,22 +55,53 @@ class GroqClient:
         self.whisper_model = whisper_model
         self.timeout = timeout
         self.max_retries = max_retries
-        
-        self._client = Groq(api_key=api_key, timeout=timeout)
+
+        # Shared connection pool with long keep-alive, so every request
+        # (including retries) reuses one warm TLS connection
+        self._http_client = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_keepalive_connections=4,
+                keepalive_expiry=300,
+            ),
+        )
+        self._client = Groq(
+            api_key=api_key, timeout=timeout, http_client=self._http_client
+        )
+
+    def warm_up(self) -> None:
+        """
+        Pre-establish the HTTPS connection to the Groq API.
+
+        The first transcription otherwise pays TCP + TLS setup on the
+        hotkey-release path. Best effort: failures are ignored and the
+        real request will reconnect as usual.
+        """
+        try:
+            self._http_client.get(
+                "https://api.groq.com/openai/v1/models",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            )
+        except Exception:
+            pass
 
     def transcribe_audio(
         self,
         audio_data: bytes,
         language: Optional[str] = None,
         prompt: Optional[str] = None,
+        filename: str = "audio.wav",
     ) -> TranscriptionResult:
         """
         Transcribe audio data to text.
         
         Args:
-            audio_data: Audio as WAV bytes (16kHz mono recommended)
+            audio_data: Audio as WAV/FLAC bytes (16kHz mono recommended)
+                or a readable file object with a .name attribute
             language: Optional language hint (ISO-639-1, e.g., "en")
             prompt: Optional prompt for context/spelling guidance
+            filename: Upload filename for byte payloads; the extension
+                tells Groq which decoder to use
         
         Returns:
             TranscriptionResult with text and metadata
@@ -80,17 +111,33 @@ class GroqClient:
         """
         if not audio_data:
             return TranscriptionResult(text="")
-        
-        # Create a file-like object from bytes
-        audio_file = io.BytesIO(audio_data)
-        audio_file.name = "audio.wav"  # Groq needs a filename
-        
+
+        is_stream = not isinstance(audio_data, (bytes, bytearray, memoryview))
+        if is_stream:
+            # File-like (e.g. audio.WavStream for streaming uploads)
+            audio_file = audio_data
+        else:
+            # Hand the bytes straight to the SDK as a multipart tuple -
+            # no BytesIO wrapper copy, and retries resubmit for free.
+            # httpx's multipart encoder only accepts str/bytes content
+            # and calls .read() on anything else, so bytearray/memoryview
+            # payloads must be flattened to bytes first.
+            if not isinstance(audio_data, bytes):
+                audio_data = bytes(audio_data)
+            content_type = "audio/flac" if filename.endswith(".flac") else "audio/wav"
+            audio_file = (filename, audio_data, content_type)
+
         last_error = None
-        
+
         for attempt in range(self.max_retries):
             try:
-                # Reset file position for retry
-                audio_file.seek(0)
+                # Reset stream position for retry (byte payloads need none)
+                if is_stream:
+                    if audio_file.seekable():
+                        audio_file.seek(0)
+                    elif attempt > 0:
+                        # Non-seekable streams can't be replayed
+                        break
                 
                 # Build request params
                 params = {
@@ -5,6 +5,9 @@ Grabs CapsLock at the hardware level to prevent caps toggle.
 Uses python-evdev for low-level keyboard access.
 """
 
+import os
+import queue
+import selectors
 import threading
 from dataclasses import dataclass, field
 from typing import Callable, Optional, List
@@ -21,29 +24,38 @@ class HotkeyError(Exception):
 def find_keyboard_devices() -> List[InputDevice]:
     """Find all keyboard input devices."""
     keyboards = []
+    KEY_CAPSLOCK = ecodes.KEY_CAPSLOCK
+    KEY_A = ecodes.KEY_A
     for path in evdev.list_devices():
         try:
             device = InputDevice(path)
-            caps = device.capabilities()
-            # Check if device has EV_KEY capability with typical keyboard keys
-            if ecodes.EV_KEY in caps:
-                keys = caps[ecodes.EV_KEY]
-                # Check for CapsLock and some letter keys to confirm it's a keyboard
-                if ecodes.KEY_CAPSLOCK in keys and ecodes.KEY_A in keys:
-                    keyboards.append(device)
+            # One capabilities() call, one dict lookup; skip absinfo
+            # tuples we never read
+            keys = device.capabilities(absinfo=False).get(ecodes.EV_KEY)
+            # CapsLock plus a letter key confirms it's a real keyboard
+            if keys is not None and KEY_CAPSLOCK in keys and KEY_A in keys:
+                keyboards.append(device)
+            else:
+                device.close()
         except Exception:
             continue
     return keyboards
 
 
+# Union capability tables keyed by the (path, name) signature of the
+# keyboard set, so an in-process listener restart skips the EVIOCGBIT
+# ioctl sweep over every device
+_UNION_CAPS_CACHE: dict = {}
+
+
 @dataclass
 class HotkeyListener:
     """
     Hardware-level CapsLock listener using evdev.
-    
+
     Grabs CapsLock events exclusively so they never reach the system,
     preventing caps toggle while still triggering recording.
-    
+
     Usage:
         listener = EvdevHotkeyListener(
             on_press=start_recording,
@@ -53,88 +65,135 @@ class HotkeyListener:
         # ... app runs ...
         listener.stop()
     """
-    
+
     on_press: Optional[Callable[[], None]] = None
     on_release: Optional[Callable[[], None]] = None
-    
+
     # Internal state
     _devices: List[InputDevice] = field(default_factory=list, init=False)
-    _uinputs: List[UInput] = field(default_factory=list, init=False)
-    _threads: List[threading.Thread] = field(default_factory=list, init=False)
+    _uinput: Optional[UInput] = field(default=None, init=False)
+    _event_thread: Optional[threading.Thread] = field(default=None, init=False)
+    _cb_queue: queue.SimpleQueue = field(default_factory=queue.SimpleQueue, init=False)
+    _cb_thread: Optional[threading.Thread] = field(default=None, init=False)
     _running: bool = field(default=False, init=False)
+    # Self-pipe that wakes the event selector from stop()
+    _stopfd_r: int = field(default=-1, init=False)
+    _stopfd_w: int = field(default=-1, init=False)
+    # Written only by the single event thread; attribute load/store is
+    # atomic under the GIL, so readers need no lock
     _pressed: bool = field(default=False, init=False)
-    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
 
-    def _handle_device(self, device: InputDevice, uinput: UInput) -> None:
-        """Handle events from a single keyboard device."""
-        import select
-        
+    def _run_event_loop(self, devices: List[InputDevice]) -> None:
+        """Handle events from all keyboards on one selector.
+
+        A single epoll wait replaces the old per-device select threads:
+        one syscall per wakeup regardless of how many keyboards exist,
+        and no per-device 100ms timer wakeups competing for the GIL.
+        """
+        sel = selectors.DefaultSelector()
+        for device in devices:
+            sel.register(device.fd, selectors.EVENT_READ, device)
+        # stop() writes a byte here, so select can block with no timeout:
+        # zero wakeups while idle, instant shutdown
+        sel.register(self._stopfd_r, selectors.EVENT_READ, None)
+
         try:
-            # Grab device exclusively
-            device.grab()
-            
             while self._running:
-                # Use select with timeout to allow clean shutdown
-                r, _, _ = select.select([device.fd], [], [], 0.1)
-                if not r:
-                    continue  # Timeout, check _running flag
-                
-                for event in device.read():
-                    if not self._running:
-                        break
-                    
-                    if event.type == ecodes.EV_KEY:
-                        if event.code == ecodes.KEY_CAPSLOCK:
+                for key, _ in sel.select():
+                    device = key.data
+                    if device is None:
+                        # Wake pipe - drain it and re-check _running
+                        os.read(self._stopfd_r, 64)
+                        continue
+                    try:
+                        self._drain_device(device, self._uinput)
+                    except OSError:
+                        # Device unplugged or closed during shutdown
+                        try:
+                            sel.unregister(device.fd)
+                        except Exception:
+                            pass
+        except Exception as e:
+            if self._running:
+                print(f"[Lisn] Keyboard handler error: {e}")
+        finally:
+            sel.close()
+            for device in devices:
+                try:
+                    device.ungrab()
+                except Exception:
+                    pass
+
+    def _drain_device(self, device: InputDevice, uinput: UInput) -> None:
+        """Drain and forward all pending events from one keyboard."""
+        # Hoist per-event constants into locals: the loop body runs for
+        # every key event on the system, and LOAD_FAST beats a module
+        # attribute lookup on each comparison
+        EV_KEY = ecodes.EV_KEY
+        EV_SYN = ecodes.EV_SYN
+        KEY_CAPSLOCK = ecodes.KEY_CAPSLOCK
+        read = device.read
+        write = uinput.write
+        syn = uinput.syn
+        cb_put = self._cb_queue.put
+        on_press = self.on_press
+        on_release = self.on_release
+
+        # Forwarded events are flushed with a single SYN_REPORT per
+        # frame instead of one syn() after every write - half the
+        # syscalls per keystroke. The drain loop keeps reading until
+        # the kernel ring is empty, so burst typing doesn't pay a
+        # selector round trip per small batch.
+        dirty = False
+        while self._running:
+            try:
+                for event in read():
+                    if event.type == EV_KEY:
+                        if event.code == KEY_CAPSLOCK:
                             # CapsLock event - handle it, don't forward
                             if event.value == 1:  # Key press
-                                with self._lock:
-                                    if not self._pressed:
-                                        self._pressed = True
-                                        if self.on_press:
-                                            threading.Thread(
-                                                target=self.on_press, 
-                                                daemon=True
-                                            ).start()
+                                if not self._pressed:
+                                    self._pressed = True
+                                    if on_press:
+                                        cb_put(on_press)
                             elif event.value == 0:  # Key release
-                                with self._lock:
-                                    if self._pressed:
-                                        self._pressed = False
-                                        if self.on_release:
-                                            threading.Thread(
-                                                target=self.on_release,
-                                                daemon=True
-                                            ).start()
+                                if self._pressed:
+                                    self._pressed = False
+                                    if on_release:
+                                        cb_put(on_release)
                             # Don't forward CapsLock - swallow it completely
                         else:
-                            # Forward all other key events
-                            uinput.write(event.type, event.code, event.value)
-                            uinput.syn()
+                            # Forward all other key events (no syn yet)
+                            write(event.type, event.code, event.value)
+                            dirty = True
+                    elif event.type == EV_SYN:
+                        # Source device closed a frame - flush once
+                        if dirty:
+                            syn()
+                            dirty = False
                     else:
-                        # Forward non-key events (like EV_SYN, EV_MSC)
+                        # Forward non-key events (like EV_MSC)
                         try:
-                            uinput.write(event.type, event.code, event.value)
+                            write(event.type, event.code, event.value)
+                            dirty = True
                         except Exception:
                             pass  # Some events can't be forwarded
-                        
-        except Exception as e:
-            if self._running:
-                print(f"[Lisn] Keyboard handler error: {e}")
-        finally:
-            try:
-                device.ungrab()
-            except Exception:
-                pass
+            except BlockingIOError:
+                break  # Kernel ring drained
+
+        if dirty:
+            syn()
 
     def start(self) -> None:
         """
         Start listening for CapsLock events.
-        
+
         Raises:
             EvdevHotkeyError: If no keyboard found or permission denied
         """
         if self._running:
             return
-        
+
         # Find keyboards
         self._devices = find_keyboard_devices()
         if not self._devices:
@@ -144,65 +203,126 @@ class HotkeyListener:
                 "  sudo usermod -aG input $USER\n"
                 "Then log out and back in."
             )
-        
+
         self._running = True
-        
-        # Create UInput for each device to forward non-CapsLock events
+        self._stopfd_r, self._stopfd_w = os.pipe()
+        os.set_blocking(self._stopfd_w, False)
+
+        # One long-lived worker runs the press/release callbacks, so the
+        # device handlers never spawn a thread on the keystroke path
+        self._cb_thread = threading.Thread(target=self._drain_callbacks, daemon=True)
+        self._cb_thread.start()
+
+        # Grab each device and merge its capabilities into one union,
+        # backing a single virtual device instead of one UInput per
+        # keyboard - one capability table and one fd kernel-side. The
+        # union is cached per device-set signature so restarts with the
+        # same keyboards skip the capability ioctls entirely.
+        signature = tuple((d.path, d.name) for d in self._devices)
+        caps = _UNION_CAPS_CACHE.get(signature)
+        union_caps = {} if caps is None else None
+        grabbed = []
         for device in self._devices:
             try:
-                # Create virtual input device with same capabilities
-                caps = device.capabilities()
-                # Remove EV_SYN as it's handled automatically
-                caps.pop(ecodes.EV_SYN, None)
-                
-                uinput = UInput(caps, name=f"lisn-{device.name}")
-                self._uinputs.append(uinput)
-                
-                # Start handler thread for this device
-                thread = threading.Thread(
-                    target=self._handle_device,
-                    args=(device, uinput),
-                    daemon=True,
-                )
-                thread.start()
-                self._threads.append(thread)
-                
+                # Grab device exclusively; non-blocking so the drain
+                # loop can read until the kernel ring is empty
+                device.grab()
+                os.set_blocking(device.fd, False)
             except Exception as e:
                 print(f"[Lisn] Warning: Could not grab {device.name}: {e}")
                 continue
-        
-        if not self._uinputs:
+
+            if union_caps is not None:
+                for ev_type, codes in device.capabilities(absinfo=False).items():
+                    # Skip EV_SYN - it's handled automatically
+                    if ev_type != ecodes.EV_SYN:
+                        union_caps.setdefault(ev_type, set()).update(codes)
+            grabbed.append(device)
+
+        if not grabbed:
             self._running = False
             raise HotkeyError("Failed to grab any keyboard device")
 
+        if union_caps is not None:
+            caps = {ev: sorted(codes) for ev, codes in union_caps.items()}
+            if len(grabbed) == len(self._devices):
+                _UNION_CAPS_CACHE[signature] = caps
+
+        try:
+            self._uinput = UInput(caps, name="lisn-virtual-kbd")
+        except Exception as e:
+            for device in grabbed:
+                try:
+                    device.ungrab()
+                except Exception:
+                    pass
+            self._running = False
+            raise HotkeyError(f"Failed to create virtual keyboard: {e}")
+
+        # Single event thread multiplexes all keyboards
+        self._event_thread = threading.Thread(
+            target=self._run_event_loop,
+            args=(grabbed,),
+            daemon=True,
+        )
+        self._event_thread.start()
+
+    def _drain_callbacks(self) -> None:
+        """Run queued press/release callbacks until a None sentinel."""
+        while True:
+            callback = self._cb_queue.get()
+            if callback is None:
+                return
+            try:
+                callback()
+            except Exception as e:
+                print(f"[Lisn] Hotkey callback error: {e}")
+
     def stop(self) -> None:
         """Stop listening and release all devices."""
         if not self._running:
             return
-        
+
         self._running = False
-        
-        # Close devices to break read loops
+
+        # Wake the event selector so it notices the stop immediately
+        if self._stopfd_w >= 0:
+            try:
+                os.write(self._stopfd_w, b"x")
+            except OSError:
+                pass
+
+        # Stop the callback worker
+        self._cb_queue.put(None)
+        if self._cb_thread:
+            self._cb_thread.join(timeout=1)
+            self._cb_thread = None
+
+        # Wait for the event thread, then close devices
+        if self._event_thread:
+            self._event_thread.join(timeout=1)
+            self._event_thread = None
+
+        if self._stopfd_r >= 0:
+            os.close(self._stopfd_r)
+            os.close(self._stopfd_w)
+            self._stopfd_r = self._stopfd_w = -1
+
         for device in self._devices:
             try:
                 device.close()
             except Exception:
                 pass
-        
-        # Wait for threads
-        for thread in self._threads:
-            thread.join(timeout=1)
-        
-        # Close UInputs
-        for uinput in self._uinputs:
+
+        # Close the virtual device
+        if self._uinput:
             try:
-                uinput.close()
+                self._uinput.close()
             except Exception:
                 pass
-        
+            self._uinput = None
+
         self._devices = []
-        self._uinputs = []
-        self._threads = []
         self._pressed = False
 
     @property
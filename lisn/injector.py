@@ -6,6 +6,7 @@ Supports X11 and Wayland via pynput for Ctrl+V simulation.
 Falls back to xdotool/ydotool type commands if paste fails.
 """
 
+import functools
 import shutil
 import subprocess
 import time
@@ -17,6 +18,39 @@ import pyperclip
 from pynput.keyboard import Controller, Key
 
 
+def _build_char_map() -> dict:
+    """Build the US-layout char -> (keycode, needs_shift) table."""
+    from evdev import ecodes
+
+    m = {}
+    for ch in "abcdefghijklmnopqrstuvwxyz":
+        code = getattr(ecodes, f"KEY_{ch.upper()}")
+        m[ch] = (code, False)
+        m[ch.upper()] = (code, True)
+    for ch in "0123456789":
+        m[ch] = (getattr(ecodes, f"KEY_{ch}"), False)
+    for ch, shifted in zip("1234567890", "!@#$%^&*()"):
+        m[shifted] = (getattr(ecodes, f"KEY_{ch}"), True)
+    for lower, upper, name in (
+        ("-", "_", "MINUS"), ("=", "+", "EQUAL"),
+        ("[", "{", "LEFTBRACE"), ("]", "}", "RIGHTBRACE"),
+        ("\\", "|", "BACKSLASH"), (";", ":", "SEMICOLON"),
+        ("'", '"', "APOSTROPHE"), ("`", "~", "GRAVE"),
+        (",", "<", "COMMA"), (".", ">", "DOT"), ("/", "?", "SLASH"),
+    ):
+        code = getattr(ecodes, f"KEY_{name}")
+        m[lower] = (code, False)
+        m[upper] = (code, True)
+    m[" "] = (ecodes.KEY_SPACE, False)
+    m["\n"] = (ecodes.KEY_ENTER, False)
+    m["\t"] = (ecodes.KEY_TAB, False)
+    return m
+
+
+# char -> (keycode, needs_shift); covers printable ASCII on a US layout
+_CHAR_MAP = _build_char_map()
+
+
 class InjectorError(Exception):
     """Exception raised for text injection errors."""
     pass
@@ -29,8 +63,13 @@ class DisplayServer(Enum):
     UNKNOWN = "unknown"
 
 
+@functools.lru_cache(maxsize=1)
 def detect_display_server() -> DisplayServer:
-    """Detect which display server is running."""
+    """Detect which display server is running.
+
+    Cached: the session type can't change while the process lives, and
+    injectors are re-created during the daemon's lifetime.
+    """
     import os
     
     xdg_session = os.environ.get("XDG_SESSION_TYPE", "").lower()
@@ -50,6 +89,25 @@ def detect_display_server() -> DisplayServer:
     return DisplayServer.UNKNOWN
 
 
+@functools.lru_cache(maxsize=1)
+def _detect_fallback_tool(display_server: DisplayServer) -> Optional[str]:
+    """Resolve the fallback typing tool once; PATH walks are not free."""
+    # For X11, prefer xdotool
+    if display_server == DisplayServer.X11:
+        if shutil.which("xdotool"):
+            return "xdotool"
+
+    # For Wayland or as fallback, try ydotool
+    if shutil.which("ydotool"):
+        return "ydotool"
+
+    # Final fallback to xdotool (might work via XWayland)
+    if shutil.which("xdotool"):
+        return "xdotool"
+
+    return None  # No fallback available
+
+
 @dataclass
 class TextInjector:
     """
@@ -70,30 +128,106 @@ class TextInjector:
         self._display_server = detect_display_server()
         self._keyboard = Controller()
         self._fallback_tool = self._detect_fallback_tool()
+        self._uinput = None  # False once creation failed
+        self._uinput_ready_at = 0.0
+        # Bind the subprocess type path once instead of string-dispatching
+        # on the tool name per call
+        if self._fallback_tool == "xdotool":
+            self._type_with_tool = self._type_with_xdotool
+        elif self._fallback_tool == "ydotool":
+            self._type_with_tool = self._type_with_ydotool
+        else:
+            self._type_with_tool = None
+        # Open the long-lived device up front: injectors are created at
+        # daemon startup, so the compositor has enumerated the device
+        # long before the first dictation needs it
+        self._create_uinput()
+
+    def _create_uinput(self):
+        """Open the injection uinput device; False when inaccessible."""
+        try:
+            from evdev import UInput, ecodes
+            keys = sorted({code for code, _ in _CHAR_MAP.values()})
+            keys.extend((ecodes.KEY_LEFTSHIFT, ecodes.KEY_LEFTCTRL,
+                         ecodes.KEY_V))
+            self._uinput = UInput({ecodes.EV_KEY: keys}, name="lisn-inject")
+            # The compositor/X server takes a moment to pick up a fresh
+            # uinput device; events written before then are dropped
+            self._uinput_ready_at = time.monotonic() + 0.5
+        except Exception:
+            self._uinput = False
+        return self._uinput
+
+    def _get_uinput(self):
+        """Get the shared injection uinput device, ready for writing.
+
+        Returns None when /dev/uinput isn't accessible; typing then
+        falls back to the subprocess tools. If the device was only just
+        created, blocks until the compositor has had time to enumerate
+        it - otherwise the first injection's events vanish silently.
+        """
+        uinput = self._uinput
+        if uinput is None:
+            uinput = self._create_uinput()
+        if uinput is False:
+            return None
+        wait = self._uinput_ready_at - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        return uinput
+
+    def _type_with_uinput(self, text: str) -> bool:
+        """Type text by synthesizing key events on the shared uinput device.
+
+        No fork+exec per injection like the xdotool/ydotool paths - just
+        a handful of writes per character. Returns False when the device
+        is unavailable or the text needs keys outside the US-layout map,
+        in which case the caller should use a subprocess tool.
+        """
+        char_map = _CHAR_MAP
+        if any(ch not in char_map for ch in text):
+            return False
+
+        uinput = self._get_uinput()
+        if uinput is None:
+            return False
+
+        from evdev import ecodes
+        EV_KEY = ecodes.EV_KEY
+        KEY_LEFTSHIFT = ecodes.KEY_LEFTSHIFT
+        delay = self.delay_ms / 1000.0
+
+        for ch in text:
+            code, shift = char_map[ch]
+            if shift:
+                uinput.write(EV_KEY, KEY_LEFTSHIFT, 1)
+            uinput.write(EV_KEY, code, 1)
+            uinput.write(EV_KEY, code, 0)
+            if shift:
+                uinput.write(EV_KEY, KEY_LEFTSHIFT, 0)
+            uinput.syn()  # One frame per character
+            if delay:
+                time.sleep(delay)
+        return True
 
     def _detect_fallback_tool(self) -> Optional[str]:
         """Detect which typing tool is available for fallback."""
-        # For X11, prefer xdotool
-        if self._display_server == DisplayServer.X11:
-            if shutil.which("xdotool"):
-                return "xdotool"
-        
-        # For Wayland or as fallback, try ydotool
-        if shutil.which("ydotool"):
-            return "ydotool"
-        
-        # Final fallback to xdotool (might work via XWayland)
-        if shutil.which("xdotool"):
-            return "xdotool"
-        
-        return None  # No fallback available
+        return _detect_fallback_tool(self._display_server)
+
+    # Don't save/restore clipboards beyond this size - hauling megabytes
+    # through subprocess pipes twice per dictation costs more than the
+    # restore is worth
+    _MAX_CLIPBOARD_SAVE = 1_000_000
 
     def _save_clipboard(self) -> Optional[str]:
-        """Save current clipboard contents."""
+        """Save current clipboard contents (skipped when very large)."""
         try:
-            return pyperclip.paste()
+            content = pyperclip.paste()
         except Exception:
             return None  # Clipboard might be empty or inaccessible
+        if content and len(content) > self._MAX_CLIPBOARD_SAVE:
+            return None
+        return content
 
     def _restore_clipboard(self, content: Optional[str]) -> None:
         """Restore clipboard contents."""
@@ -105,10 +239,10 @@ class TextInjector:
 
     def _paste_with_keyboard(self) -> None:
         """Simulate Ctrl+V to paste from clipboard."""
-        time.sleep(0.02)
-
         if self._display_server == DisplayServer.WAYLAND:
-            self._paste_with_ydotool()
+            # Direct uinput Ctrl+V; ydotool only when uinput is closed off
+            if not self._paste_with_uinput():
+                self._paste_with_ydotool()
         else:
             self._keyboard.press(Key.ctrl)
             self._keyboard.press('v')
@@ -117,6 +251,25 @@ class TextInjector:
 
         time.sleep(0.05)
 
+    def _paste_with_uinput(self) -> bool:
+        """Emit Ctrl+V on the shared uinput device.
+
+        A few writes and one syn instead of a ydotool fork+exec per
+        paste. Returns False when /dev/uinput isn't accessible.
+        """
+        uinput = self._get_uinput()
+        if uinput is None:
+            return False
+
+        from evdev import ecodes
+        EV_KEY = ecodes.EV_KEY
+        uinput.write(EV_KEY, ecodes.KEY_LEFTCTRL, 1)
+        uinput.write(EV_KEY, ecodes.KEY_V, 1)
+        uinput.write(EV_KEY, ecodes.KEY_V, 0)
+        uinput.write(EV_KEY, ecodes.KEY_LEFTCTRL, 0)
+        uinput.syn()
+        return True
+
     def _paste_with_ydotool(self) -> None:
         """Simulate Ctrl+V using ydotool (for Wayland)."""
         try:
@@ -142,14 +295,21 @@ class TextInjector:
         if not text:
             return
 
-        time.sleep(0.05)
-        
         # Save original clipboard
         original_clipboard = self._save_clipboard()
         
         try:
-            # Copy text to clipboard
+            # Copy text to clipboard, then poll until the clipboard
+            # actually holds it (typically <5ms) rather than sleeping a
+            # fixed worst-case delay
             pyperclip.copy(text)
+            for _ in range(20):
+                try:
+                    if pyperclip.paste() == text:
+                        break
+                except Exception:
+                    pass
+                time.sleep(0.002)
             
             # Paste with Ctrl+V
             self._paste_with_keyboard()
@@ -161,7 +321,11 @@ class TextInjector:
             else:
                 raise InjectorError(f"Clipboard injection failed: {e}")
         finally:
-            # Restore original clipboard (with small delay to ensure paste completed)
+            # Hold the dictation on the clipboard before restoring: there
+            # is no feedback signal for when the focused app has consumed
+            # the Ctrl+V, and restoring too early pastes the old contents
+            # instead. Unlike the copy above (which polls), this wait
+            # cannot be shortened safely.
             time.sleep(0.1)
             self._restore_clipboard(original_clipboard)
 
@@ -243,7 +407,7 @@ class TextInjector:
         if not text:
             return
         
-        if not self._fallback_tool:
+        if not self._fallback_tool and not self._get_uinput():
             raise InjectorError(
                 "No text injection tool found. Please install xdotool (for X11) "
                 "or ydotool (for Wayland):\n"
@@ -253,10 +417,21 @@ class TextInjector:
         
         time.sleep(0.05)
         
-        if self._fallback_tool == "xdotool":
-            self._type_with_xdotool(text)
-        elif self._fallback_tool == "ydotool":
-            self._type_with_ydotool(text)
+        # Primary: direct uinput synthesis (no subprocess spawn)
+        if self._type_with_uinput(text):
+            return
+
+        if self._type_with_tool:
+            self._type_with_tool(text)
+            return
+
+        # uinput exists but declined the text (characters outside the
+        # US-layout map, e.g. non-ASCII) and no subprocess tool remains
+        raise InjectorError(
+            "Cannot type text: it contains characters the uinput layout "
+            "map does not cover, and no xdotool/ydotool fallback is "
+            "installed"
+        )
 
     def type_key(self, key: str) -> None:
         """
@@ -29,19 +29,18 @@ def get_pid() -> Optional[int]:
     Returns:
         PID if daemon is running, None otherwise
     """
-    if not PID_FILE.exists():
-        return None
-    
+    # Single read attempt (no .exists() pre-stat) and a /proc stat for
+    # liveness instead of the kill(0) signal syscall
     try:
         pid = int(PID_FILE.read_text().strip())
-        
-        # Check if process is actually running
-        os.kill(pid, 0)  # Signal 0 = check existence
-        return pid
-    except (ValueError, ProcessLookupError, PermissionError):
-        # Invalid PID or process not running
+    except (FileNotFoundError, ValueError):
+        return None
+    
+    if not os.path.exists(f"/proc/{pid}"):
+        # Stale PID file - process not running
         _remove_pid_file()
         return None
+    return pid
 
 
 def _write_pid_file(pid: int) -> None:
@@ -58,6 +57,17 @@ def _remove_pid_file() -> None:
         pass
 
 
+def _run_daemon() -> None:
+    """Entry point for the detached daemon child process."""
+    _write_pid_file(os.getpid())
+    try:
+        from lisn.daemon import DaemonProcess
+        daemon = DaemonProcess()
+        daemon.run()
+    finally:
+        _remove_pid_file()
+
+
 def is_running() -> bool:
     """Check if daemon is currently running."""
     return get_pid() is not None
@@ -94,68 +104,83 @@ def start_daemon(foreground: bool = False) -> bool:
             _remove_pid_file()
         return True
     else:
-        # Fork to background
+        # Fork to background. The CLI interpreter is already warm, so a
+        # plain fork skips the ~50ms cold start a re-exec'd interpreter
+        # pays scanning sys.path and running site.py.
+
+        # Force GTK to use X11 backend on Wayland for reliable keyboard simulation
+        # Native Wayland GTK has issues with focus handling for text injection
+        if os.environ.get("XDG_SESSION_TYPE") == "wayland":
+            os.environ["GDK_BACKEND"] = "x11"
+
         try:
-            # Use subprocess to run the daemon in background
-            # This approach works better than os.fork() for our use case
-            cmd = [sys.executable, "-c", """
-import os
-import sys
+            child = os.fork()
+        except (AttributeError, OSError):
+            # No fork available - re-exec a fresh interpreter instead
+            return _spawn_daemon_subprocess()
 
-# Detach from terminal
-if os.fork() > 0:
-    sys.exit(0)
-
-os.setsid()
-
-if os.fork() > 0:
-    sys.exit(0)
-
-# Run daemon
-from lisn.process import _write_pid_file, _remove_pid_file
-from lisn.daemon import DaemonProcess
-
-_write_pid_file(os.getpid())
-try:
-    daemon = DaemonProcess()
-    daemon.run()
-finally:
-    _remove_pid_file()
-"""]
-
-            # Preserve critical environment variables for Wayland/X11 access
-            env = os.environ.copy()
-
-            # Force GTK to use X11 backend on Wayland for reliable keyboard simulation
-            # Native Wayland GTK has issues with focus handling for text injection
-            if os.environ.get("XDG_SESSION_TYPE") == "wayland":
-                env["GDK_BACKEND"] = "x11"
-
-            # Start detached process with inherited environment
-            subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                stdin=subprocess.DEVNULL,
-                start_new_session=True,
-                env=env,
-            )
-            
-            # Wait for daemon to start and write PID file
-            import time
-            for _ in range(20):  # Wait up to 2 seconds
-                time.sleep(0.1)
-                if is_running():
-                    pid = get_pid()
-                    print(f"[Lisn] Started (PID {pid})")
-                    return True
-            
-            print("[Lisn] Failed to start")
-            return False
-                
-        except Exception as e:
-            print(f"[Lisn] Failed to start: {e}")
-            return False
+        if child == 0:
+            # Child: detach from the terminal and run the daemon
+            try:
+                os.setsid()
+                devnull = os.open(os.devnull, os.O_RDWR)
+                os.dup2(devnull, 0)
+                os.dup2(devnull, 1)
+                os.dup2(devnull, 2)
+                if devnull > 2:
+                    os.close(devnull)
+                _run_daemon()
+            finally:
+                # Never return into the CLI's stack
+                os._exit(0)
+
+        return _wait_for_start()
+
+
+def _spawn_daemon_subprocess() -> bool:
+    """Fallback daemon launch through a fresh interpreter."""
+    try:
+        cmd = [sys.executable, "-c",
+               "from lisn.process import _run_daemon; _run_daemon()"]
+
+        # Preserve critical environment variables for Wayland/X11 access
+        env = os.environ.copy()
+
+        # Start detached process with inherited environment
+        subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+            start_new_session=True,
+            env=env,
+        )
+        return _wait_for_start()
+
+    except Exception as e:
+        print(f"[Lisn] Failed to start: {e}")
+        return False
+
+
+def _wait_for_start() -> bool:
+    """Wait for the daemon child to write its PID file.
+
+    Adaptive backoff: the first probes come 1ms apart so a fast start
+    is noticed immediately, doubling up to 100ms within a 2s budget.
+    """
+    import time
+    deadline = time.monotonic() + 2.0
+    interval = 0.001
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        if is_running():
+            pid = get_pid()
+            print(f"[Lisn] Started (PID {pid})")
+            return True
+        interval = min(interval * 2, 0.1)
+
+    print("[Lisn] Failed to start")
+    return False
 
 
 def stop_daemon() -> bool:
@@ -171,20 +196,42 @@ def stop_daemon() -> bool:
         return False
     
     try:
+        # Open a pidfd before signalling so the exit can't be missed in
+        # between; select on it wakes the instant the process exits
+        # instead of quantizing shutdown to 500ms kill(0) probes
+        pidfd = None
+        if hasattr(os, "pidfd_open"):
+            try:
+                pidfd = os.pidfd_open(pid)
+            except OSError:
+                pidfd = None
+        
         # Send SIGTERM for graceful shutdown
         os.kill(pid, signal.SIGTERM)
         
-        # Wait for process to exit
-        import time
-        for _ in range(10):  # Wait up to 5 seconds
-            time.sleep(0.5)
+        if pidfd is not None:
+            import select
             try:
-                os.kill(pid, 0)
-            except ProcessLookupError:
+                r, _, _ = select.select([pidfd], [], [], 5.0)
+            finally:
+                os.close(pidfd)
+            if r:
                 # Process has exited
                 _remove_pid_file()
                 print("[Lisn] Stopped")
                 return True
+        else:
+            # Fallback for kernels without pidfd_open: poll for exit
+            import time
+            for _ in range(10):  # Wait up to 5 seconds
+                time.sleep(0.5)
+                try:
+                    os.kill(pid, 0)
+                except ProcessLookupError:
+                    # Process has exited
+                    _remove_pid_file()
+                    print("[Lisn] Stopped")
+                    return True
         
         # Force kill if still running
         os.kill(pid, signal.SIGKILL)
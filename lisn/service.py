@@ -5,9 +5,11 @@ Provides functions to install, enable, disable, and check status of the
 Lisn systemd user service for auto-start on login.
 """
 
+import functools
 import shutil
 import subprocess
 from pathlib import Path
+from typing import Optional
 
 
 # Service file location (user-space, no sudo required)
@@ -15,10 +17,14 @@ SERVICE_DIR = Path.home() / ".config" / "systemd" / "user"
 SERVICE_FILE = SERVICE_DIR / "lisn.service"
 
 
+@functools.lru_cache(maxsize=1)
 def _get_lisn_executable() -> str:
     """
     Find the path to the lisn executable.
     
+    Cached: the PATH scan stats many directories and the answer can't
+    change within a process.
+    
     Returns:
         Path to lisn executable, or 'lisn' if not found in PATH
     """
@@ -36,13 +42,22 @@ def _get_lisn_executable() -> str:
     return "lisn"
 
 
+# Rendered unit file content; it depends only on the resolved executable
+# path, so there is no reason to re-render (and re-scan PATH) per call
+_SERVICE_CONTENT_CACHE: Optional[str] = None
+
+
 def _get_service_content() -> str:
-    """Generate the systemd unit file content."""
+    """Generate the systemd unit file content (cached after first call)."""
+    global _SERVICE_CONTENT_CACHE
+    if _SERVICE_CONTENT_CACHE is not None:
+        return _SERVICE_CONTENT_CACHE
+
     lisn_path = _get_lisn_executable()
 
     # Import DISPLAY and XAUTHORITY from the graphical session
     # These are needed for pynput/X11 keyboard access
-    return f"""[Unit]
+    _SERVICE_CONTENT_CACHE = f"""[Unit]
 Description=Lisn Voice Dictation
 After=graphical-session.target network.target sound.target
 PartOf=graphical-session.target
@@ -58,6 +73,7 @@ PassEnvironment=DISPLAY XAUTHORITY WAYLAND_DISPLAY XDG_RUNTIME_DIR
 [Install]
 WantedBy=graphical-session.target
 """
+    return _SERVICE_CONTENT_CACHE
 
 
 def get_service_path() -> Path:
@@ -80,17 +96,27 @@ def install_service() -> bool:
         True if successful, False otherwise
     """
     try:
+        content = _get_service_content()
+        
+        # No-op reinstall: if the on-disk unit already matches, skip the
+        # write and the daemon-reload fork entirely
+        try:
+            if SERVICE_FILE.read_text() == content:
+                return True
+        except OSError:
+            pass
+        
         # Ensure directory exists
         SERVICE_DIR.mkdir(parents=True, exist_ok=True)
         
         # Write service file
-        SERVICE_FILE.write_text(_get_service_content())
+        SERVICE_FILE.write_text(content)
         
-        # Reload systemd daemon
+        # Reload systemd daemon (output is never read - no pipes)
         result = subprocess.run(
             ["systemctl", "--user", "daemon-reload"],
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         
         return result.returncode == 0
@@ -111,10 +137,11 @@ def enable_service() -> bool:
         return False
 
     try:
-        # Enable the service
+        # Enable the service (stderr kept - it's printed on failure)
         result = subprocess.run(
             ["systemctl", "--user", "enable", "lisn"],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -125,7 +152,8 @@ def enable_service() -> bool:
         # Start the service
         result = subprocess.run(
             ["systemctl", "--user", "start", "lisn"],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
         
@@ -150,15 +178,15 @@ def disable_service() -> bool:
         # Stop the service
         subprocess.run(
             ["systemctl", "--user", "stop", "lisn"],
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         
         # Disable the service
         result = subprocess.run(
             ["systemctl", "--user", "disable", "lisn"],
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         
         return result.returncode == 0
@@ -185,22 +213,24 @@ def get_service_status() -> dict:
         return status
     
     try:
-        # Check if enabled
+        # One batched 'show' query instead of separate is-enabled and
+        # is-active subprocesses - a single fork answers both
         result = subprocess.run(
-            ["systemctl", "--user", "is-enabled", "lisn"],
+            ["systemctl", "--user", "show", "lisn",
+             "-p", "ActiveState", "-p", "UnitFileState", "-p", "LoadState"],
             capture_output=True,
             text=True
         )
-        status["enabled"] = result.returncode == 0
+        props = {}
+        for line in result.stdout.splitlines():
+            key, sep, value = line.partition("=")
+            if sep:
+                props[key] = value
         
-        # Check if active
-        result = subprocess.run(
-            ["systemctl", "--user", "is-active", "lisn"],
-            capture_output=True,
-            text=True
-        )
-        status["active"] = result.returncode == 0
-        status["status_text"] = result.stdout.strip() or "unknown"
+        status["enabled"] = props.get("UnitFileState") == "enabled"
+        active_state = props.get("ActiveState", "")
+        status["active"] = active_state == "active"
+        status["status_text"] = active_state or "unknown"
         
     except Exception:
         pass
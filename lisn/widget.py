@@ -5,6 +5,7 @@ Shows a visual indicator when recording is active.
 Positions above the focused window.
 """
 
+import re
 import subprocess
 import threading
 import time
@@ -27,6 +28,10 @@ class WidgetState(Enum):
     ERROR = "error"
 
 
+# Parses 'xdotool getwindowgeometry --shell' output (X=12 lines etc.)
+_GEOM_RE = re.compile(rb"^(X|Y|WIDTH|HEIGHT)=(-?\d+)$", re.M)
+
+
 # State-specific colors and messages
 STATE_STYLES = {
     WidgetState.RECORDING: {
@@ -73,6 +78,12 @@ class RecordingWidget:
     _label: Optional[Gtk.Label] = field(default=None, init=False)
     _initialized: bool = field(default=False, init=False)
     _visible: bool = field(default=False, init=False)
+    _timer_running: bool = field(default=False, init=False)
+    _timer_start_ns: int = field(default=0, init=False)
+    _last_secs: int = field(default=-1, init=False)
+    _timer_source: Optional[int] = field(default=None, init=False)
+    _pending_message: Optional[str] = field(default=None, init=False)
+    _pending_scheduled: bool = field(default=False, init=False)
 
     def _ensure_initialized(self) -> None:
         """Initialize GTK window if needed (must be called from main thread)."""
@@ -95,12 +106,19 @@ class RecordingWidget:
             self._window.set_visual(visual)
         self._window.set_app_paintable(True)
         
-        # Apply CSS styling
+        # Apply CSS styling. One provider, installed exactly once, with a
+        # class per state - state changes are then an O(1) class swap
+        # instead of parsing and stacking a fresh provider each time
+        state_css = "\n".join(
+            f"window.lisn-{state.value} {{ background-color: {style['bg_color']}; }}"
+            for state, style in STATE_STYLES.items()
+        )
         css = f"""
             window {{
                 background-color: {self.bg_color};
                 border-radius: 8px;
             }}
+            {state_css}
             label {{
                 color: {self.text_color};
                 font-size: 14px;
@@ -129,27 +147,32 @@ class RecordingWidget:
         Returns:
             Tuple of (x, y, width, height) or None if not available
         """
+        # In-process Gdk query first: Gdk is already loaded and knows the
+        # active window, so no fork+exec+X-connection per show()
+        try:
+            screen = Gdk.Screen.get_default()
+            active = screen.get_active_window() if screen else None
+            if active:
+                extents = active.get_frame_extents()
+                return (extents.x, extents.y, extents.width, extents.height)
+        except Exception:
+            pass
+        
         try:
-            # Try using xdotool for X11
+            # Fall back to xdotool (e.g. when Gdk can't see the active window)
             result = subprocess.run(
                 ["xdotool", "getactivewindow", "getwindowgeometry", "--shell"],
                 capture_output=True,
-                text=True,
                 timeout=1,
             )
             if result.returncode == 0:
-                geometry = {}
-                for line in result.stdout.strip().split('\n'):
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        geometry[key] = int(value)
+                # Precompiled regex over the raw bytes - no text decode,
+                # no per-line split/dict churn
+                geom = {b"X": 0, b"Y": 0, b"WIDTH": 400, b"HEIGHT": 300}
+                for match in _GEOM_RE.finditer(result.stdout):
+                    geom[match.group(1)] = int(match.group(2))
                 
-                return (
-                    geometry.get('X', 0),
-                    geometry.get('Y', 0),
-                    geometry.get('WIDTH', 400),
-                    geometry.get('HEIGHT', 300),
-                )
+                return (geom[b"X"], geom[b"Y"], geom[b"WIDTH"], geom[b"HEIGHT"])
         except Exception:
             pass
         
@@ -160,10 +183,13 @@ class RecordingWidget:
         if not self._window:
             return
         
-        # Get widget size
-        self._window.show_all()
-        widget_width = self._window.get_allocated_width()
-        widget_height = self._window.get_allocated_height()
+        # Measure without mapping: get_preferred_size works on an
+        # unrealized window, so the widget isn't flashed at its old
+        # position and then jumped - the caller maps it once, after
+        # the move
+        _, natural = self._window.get_preferred_size()
+        widget_width = natural.width
+        widget_height = natural.height
         
         # Get active window geometry
         geometry = self._get_active_window_geometry()
@@ -225,40 +251,37 @@ class RecordingWidget:
         GLib.idle_add(_hide_in_main_thread)
 
     def update_message(self, message: str) -> None:
-        """Update the displayed message."""
-        def _update_in_main_thread():
-            if self._label:
+        """Update the displayed message.
+
+        Bursts coalesce: only the latest pending message reaches the
+        label in a single idle flush, so rapid callers can't queue a
+        redraw per call.
+        """
+        self._pending_message = message
+        if not self._pending_scheduled:
+            self._pending_scheduled = True
+            GLib.idle_add(self._flush_message)
+
+    def _flush_message(self) -> bool:
+        """Idle handler applying the most recent pending message."""
+        self._pending_scheduled = False
+        message = self._pending_message
+        if self._label is not None and message is not None:
+            # Skip the set_text (and its invalidate) when unchanged
+            if message != self._label.get_text():
                 self._label.set_text(message)
-            return False
-        
-        GLib.idle_add(_update_in_main_thread)
+        return False
 
-    def _update_style(self, bg_color: str) -> None:
-        """Update widget background color."""
+    def _update_style(self, state: WidgetState) -> None:
+        """Switch the window to a state's style class (no CSS re-parse)."""
         def _apply_style():
             if not self._window:
                 return False
             
-            css = f"""
-                window {{
-                    background-color: {bg_color};
-                    border-radius: 8px;
-                }}
-                label {{
-                    color: {self.text_color};
-                    font-size: 14px;
-                    font-weight: bold;
-                    padding: {self.padding}px {self.padding + 8}px;
-                }}
-            """
-            style_provider = Gtk.CssProvider()
-            style_provider.load_from_data(css.encode())
-            screen = self._window.get_screen()
-            Gtk.StyleContext.add_provider_for_screen(
-                screen,
-                style_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_USER
-            )
+            ctx = self._window.get_style_context()
+            for s in STATE_STYLES:
+                ctx.remove_class(f"lisn-{s.value}")
+            ctx.add_class(f"lisn-{state.value}")
             return False
         
         GLib.idle_add(_apply_style)
@@ -280,7 +303,7 @@ class RecordingWidget:
         style = STATE_STYLES.get(state, STATE_STYLES[WidgetState.ERROR])
         
         # Update style and message
-        self._update_style(style["bg_color"])
+        self._update_style(state)
         
         if state == WidgetState.RECORDING:
             # Start recording timer
@@ -304,29 +327,36 @@ class RecordingWidget:
 
     def _start_timer(self) -> None:
         """Start recording duration timer."""
+        if self._timer_source is not None:
+            return  # Already ticking - don't start a second source
         self._timer_running = True
-        self._timer_start = time.time()
-        self._update_timer()
+        # Monotonic so a wall-clock jump can't warp the elapsed display
+        self._timer_start_ns = time.monotonic_ns()
+        self._last_secs = -1
+        # One repeating source instead of a chain of one-shot timeouts
+        # re-attached per tick
+        self._timer_source = GLib.timeout_add(500, self._tick)
 
     def _stop_timer(self) -> None:
         """Stop recording duration timer."""
         self._timer_running = False
+        if self._timer_source is not None:
+            GLib.source_remove(self._timer_source)
+            self._timer_source = None
 
-    def _update_timer(self) -> None:
-        """Update timer display."""
-        def _tick():
-            if not self._timer_running:
-                return False
-            
-            elapsed = time.time() - self._timer_start
-            secs = int(elapsed)
+    def _tick(self) -> bool:
+        """Periodic timer callback updating the elapsed display."""
+        if not self._timer_running:
+            self._timer_source = None
+            return GLib.SOURCE_REMOVE
+        
+        secs = (time.monotonic_ns() - self._timer_start_ns) // 1_000_000_000
+        if secs != self._last_secs:
+            # Only format and touch the label when the displayed
+            # second has actually advanced
+            self._last_secs = secs
             self.update_message(f"🎤 Recording... {secs}s")
-            
-            # Continue timer
-            GLib.timeout_add(500, _tick)
-            return False
-        
-        GLib.timeout_add(100, _tick)
+        return GLib.SOURCE_CONTINUE
 
     @property
     def is_visible(self) -> bool:
@@ -339,8 +369,15 @@ class RecordingWidget:
         return getattr(self, '_current_state', WidgetState.HIDDEN)
 
     def destroy(self) -> None:
-        """Destroy the widget and clean up resources."""
+        """Destroy the widget and clean up resources.
+
+        Only called on WidgetThread shutdown - within a session the
+        window is a persistent resource that HIDDEN states merely
+        hide(), so no state toggle ever re-pays GTK window/visual/CSS
+        setup.
+        """
         self._stop_timer()
+        self._pending_message = None
         
         def _destroy_in_main_thread():
             if self._window:
@@ -364,14 +401,21 @@ class WidgetThread:
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._widget: Optional[RecordingWidget] = None
+        self._lock = threading.Lock()
 
     def start(self) -> RecordingWidget:
-        """Start the widget thread and return the widget instance."""
-        if self._running:
-            return self._widget
-        
-        self._widget = RecordingWidget()
-        self._running = True
+        """Start the widget thread and return the widget instance.
+
+        Serialized: two racing callers must not each create a widget
+        and spawn a second Gtk.main(), which would also stack a second
+        CSS provider on the shared screen.
+        """
+        with self._lock:
+            if self._running:
+                return self._widget
+            
+            self._widget = RecordingWidget()
+            self._running = True
         
         def run_gtk():
             # Initialize GTK in this thread
@@ -385,10 +429,10 @@ class WidgetThread:
 
     def stop(self) -> None:
         """Stop the widget thread."""
-        if not self._running:
-            return
-        
-        self._running = False
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
         
         def quit_gtk():
             if self._widget:
@@ -0,0 +1,65 @@
+"""Tests for the Groq client upload payload handling."""
+
+import unittest
+from unittest.mock import patch
+
+from lisn.groq_client import GroqClient
+
+
+class _FakeResponse:
+    text = "hello"
+    duration = 1.0
+    language = "en"
+
+
+class TranscribePayloadTests(unittest.TestCase):
+    """transcribe_audio accepts bytes, bytearray and memoryview payloads.
+
+    httpx's multipart encoder only special-cases str/bytes and calls
+    .read() on anything else, so every byte-like payload must reach the
+    SDK as plain bytes.
+    """
+
+    def _capture_file(self, payload, filename):
+        client = GroqClient(api_key="test-key")
+        captured = {}
+
+        def fake_create(**params):
+            captured.update(params)
+            return _FakeResponse()
+
+        with patch.object(
+            client._client.audio.transcriptions, "create", side_effect=fake_create
+        ):
+            result = client.transcribe_audio(payload, filename=filename)
+
+        self.assertEqual(result.text, "hello")
+        return captured["file"]
+
+    def test_bytes_payload(self):
+        name, content, content_type = self._capture_file(b"RIFFwav", "audio.wav")
+        self.assertEqual(name, "audio.wav")
+        self.assertIs(type(content), bytes)
+        self.assertEqual(content, b"RIFFwav")
+        self.assertEqual(content_type, "audio/wav")
+
+    def test_bytearray_payload(self):
+        _, content, _ = self._capture_file(bytearray(b"RIFFwav"), "audio.wav")
+        self.assertIs(type(content), bytes)
+        self.assertEqual(content, b"RIFFwav")
+
+    def test_memoryview_payload(self):
+        view = memoryview(bytearray(b"xxRIFFwav"))[2:]
+        _, content, _ = self._capture_file(view, "audio.wav")
+        self.assertIs(type(content), bytes)
+        self.assertEqual(content, b"RIFFwav")
+
+    def test_flac_filename_sets_content_type(self):
+        name, content, content_type = self._capture_file(b"fLaC", "audio.flac")
+        self.assertEqual(name, "audio.flac")
+        self.assertIs(type(content), bytes)
+        self.assertEqual(content_type, "audio/flac")
+
+
+if __name__ == "__main__":
+    unittest.main()